@@ -1,7 +1,58 @@
 import os
 import argparse
 import sys
-from PIL import Image
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import pymupdf  # PyMuPDF
+
+SUPPORTED_INPUT_EXTS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff"})
+
+
+def _image_size(data):
+    """
+    Read an image's pixel size from its header with MuPDF, without decoding it.
+
+    Pillow is not used, so its decompression-bomb limit neither rejects large
+    scans nor needs to be lifted. (pymupdf.image_profile would do the same, but
+    raises TypeError for any input in PyMuPDF 1.28.)
+
+    Returns:
+        tuple: (width, height) in pixels.
+    """
+    image = pymupdf.mupdf.fz_new_image_from_buffer(pymupdf.mupdf.fz_new_buffer_from_copied_data(data))
+    return image.w(), image.h()
+
+
+def _load_image(img_path):
+    """
+    Read an image file.
+
+    Args:
+        img_path (str): Path to the image file.
+
+    Returns:
+        tuple: (data, None) on success, or (None, exception) if the file could
+        not be read.
+    """
+    try:
+        with open(img_path, "rb") as f:
+            return f.read(), None
+    except Exception as e:
+        return None, e
+
+
+def _prefetch(executor, fn, items, depth):
+    """
+    Like executor.map, but with at most `depth` results submitted ahead of the
+    consumer, so loaded files are not all held in memory at once.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= depth:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 def convert_images_to_pdf(image_paths, output_pdf_path, dpi=300, verbose=False):
@@ -17,35 +68,42 @@ def convert_images_to_pdf(image_paths, output_pdf_path, dpi=300, verbose=False):
     if not image_paths:
         raise ValueError("No image paths provided.")
 
-    images = []
-    for i, img_path in enumerate(image_paths):
-        if verbose:
-            print(f"Processing image {i+1}/{len(image_paths)}: {img_path}")
+    # Embed each file's original bytes as an image XObject so JPEGs are copied
+    # without re-encoding. Files are read on a thread pool (I/O releases the GIL)
+    # a bounded number ahead of the page being inserted, in input order. All
+    # MuPDF calls, including the header probe, stay on this thread.
+    workers = os.cpu_count() or 1
+    doc = pymupdf.open()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = _prefetch(executor, _load_image, image_paths, depth=2 * workers)
+            for i, (img_path, (data, error)) in enumerate(zip(image_paths, loaded)):
+                if verbose:
+                    print(f"Processing image {i+1}/{len(image_paths)}: {img_path}")
+                page = None
+                try:
+                    if data is None:
+                        raise error
+                    width, height = _image_size(data)
+                    page = doc.new_page(width=width * 72 / dpi, height=height * 72 / dpi)
+                    page.insert_image(page.rect, stream=data)
+                except Exception as e:
+                    if page is not None:
+                        doc.delete_page(page.number)
+                    print(f"Warning: Could not open or convert image '{img_path}': {e}", file=sys.stderr)
+                    continue
+
+        if doc.page_count == 0:
+            raise RuntimeError("No valid images were processed to create the PDF.")
+
         try:
-            img = Image.open(img_path).convert("RGB")
-            images.append(img)
+            doc.save(output_pdf_path, garbage=4, deflate=True, use_objstms=True)
+            if verbose:
+                print(f"Successfully created PDF: {output_pdf_path}")
         except Exception as e:
-            print(f"Warning: Could not open or convert image '{img_path}': {e}", file=sys.stderr)
-            continue
-
-    if not images:
-        raise RuntimeError("No valid images were processed to create the PDF.")
-
-    first_image = images[0]
-    rest_images = images[1:]
-
-    try:
-        first_image.save(
-            output_pdf_path,
-            "PDF",
-            resolution=dpi,
-            save_all=True,
-            append_images=rest_images,
-        )
-        if verbose:
-            print(f"Successfully created PDF: {output_pdf_path}")
-    except Exception as e:
-        raise RuntimeError(f"Error saving PDF '{output_pdf_path}': {e}")
+            raise RuntimeError(f"Error saving PDF '{output_pdf_path}': {e}")
+    finally:
+        doc.close()
 
 
 def parse_args(argv=None):
@@ -76,14 +134,16 @@ def main(argv=None):
     image_paths = []
     if os.path.isdir(input_path):
         # Collect all common image file types from the directory
-        for filename in sorted(os.listdir(input_path)):
-            if filename.lower().endswith((".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff")):
-                image_paths.append(os.path.join(input_path, filename))
+        with os.scandir(input_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() in SUPPORTED_INPUT_EXTS and entry.is_file():
+                image_paths.append(entry.path)
         if not image_paths:
             print(f"Error: No image files found in directory '{input_path}'.", file=sys.stderr)
             return 1
     elif os.path.isfile(input_path):
-        if not input_path.lower().endswith((".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff")):
+        if os.path.splitext(input_path)[1].lower() not in SUPPORTED_INPUT_EXTS:
             print(f"Error: Input file '{input_path}' is not a recognized image format.", file=sys.stderr)
             return 1
         image_paths.append(input_path)
@@ -1,11 +1,113 @@
+import io
 import os
 import argparse
 import sys
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import pymupdf  # PyMuPDF
 
+JPEG_FORMATS = ("jpg", "jpeg")
+WRITER_THREADS = 2
+# Pillow (mode, raw mode) per pixmap component count. MuPDF stores alpha
+# pixmaps premultiplied, hence the "La"/"RGBa" raw modes.
+PIL_MODES = {1: ("L", "L"), 2: ("LA", "La"), 3: ("RGB", "RGB"), 4: ("RGBA", "RGBa")}
 
-def convert_pdf_to_images(pdf_path, output_folder, dpi=300, first_page=None, last_page=None, image_format="png", verbose=False):
-    """Convert a PDF into images using PyMuPDF.
+# TurboJPEG() locates and loads libturbojpeg (find_library runs ldconfig on
+# Linux), so one instance is created on first use and shared. encode() opens
+# its own compressor handle per call, which makes sharing it thread-safe.
+_turbojpeg = None
+_turbojpeg_lock = threading.Lock()
+
+
+def _get_turbojpeg():
+    global _turbojpeg
+    with _turbojpeg_lock:
+        if _turbojpeg is None:
+            from turbojpeg import TurboJPEG
+
+            _turbojpeg = TurboJPEG()
+        return _turbojpeg
+
+
+def _pil_encode(samples, width, height, n, **params):
+    """Encode raw pixmap samples with Pillow, which releases the GIL while encoding.
+
+    Args:
+        samples (bytes): Packed pixel data, `n` bytes per pixel, with color
+            premultiplied by alpha when there is an alpha channel.
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        n (int): Number of components (1 gray, 3 RGB, plus 1 with alpha).
+        **params: Passed on to PIL.Image.save (format, quality, ...).
+
+    Returns:
+        bytes: The encoded image.
+    """
+    from PIL import Image
+
+    mode, raw_mode = PIL_MODES[n]
+    if raw_mode == "La":
+        # Pillow cannot unpack "La" straight into an LA image, so go through La
+        img = Image.frombuffer(raw_mode, (width, height), samples, "raw", raw_mode, 0, 1).convert(mode)
+    else:
+        img = Image.frombuffer(mode, (width, height), samples, "raw", raw_mode, 0, 1)
+    buf = io.BytesIO()
+    img.save(buf, **params)
+    return buf.getvalue()
+
+
+def _encode_jpeg(samples, width, height, n, encoder="pillow", quality=85, resolution=(96, 96)):
+    """Encode raw pixmap samples as JPEG.
+
+    Args:
+        samples (bytes): Packed gray or RGB pixel data.
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        n (int): Number of components (1 or 3).
+        encoder (str): "pillow" (Pillow built against libjpeg-turbo) or
+            "turbojpeg" (PyTurboJPEG, calls libturbojpeg directly).
+        quality (int): JPEG quality (1-100).
+        resolution (tuple): (x, y) DPI recorded in the file (Pillow only).
+
+    Returns:
+        bytes: The encoded JPEG image.
+    """
+    if encoder == "turbojpeg":
+        import numpy as np
+        from turbojpeg import TJPF_GRAY, TJPF_RGB, TJSAMP_GRAY
+
+        jpeg = _get_turbojpeg()
+        pixels = np.frombuffer(samples, dtype=np.uint8).reshape(height, width, n)
+        if n == 1:
+            return jpeg.encode(pixels, quality=quality, pixel_format=TJPF_GRAY, jpeg_subsample=TJSAMP_GRAY)
+        return jpeg.encode(pixels, quality=quality, pixel_format=TJPF_RGB)
+    return _pil_encode(samples, width, height, n, format="JPEG", quality=quality, optimize=False, dpi=resolution)
+
+
+def _write_images(write_queue, lock, errors, verbose):
+    """Writer stage: pop (path, bytes) items off the queue until a None sentinel."""
+    while True:
+        item = write_queue.get()
+        if item is None:
+            return
+        image_path, data = item
+        try:
+            with open(image_path, "wb") as f:
+                f.write(data)
+        except Exception as e:
+            # Keep draining so render threads never block on a full queue
+            with lock:
+                errors.append(e)
+            continue
+        if verbose:
+            with lock:
+                print(f"Saved: {image_path}")
+
+
+def convert_pdf_to_images(pdf_path, output_folder, dpi=300, first_page=None, last_page=None, image_format="png", verbose=False, workers=None, encoder="pillow", png_level=None, backend="pymupdf", colorspace="rgb", alpha=False, jpeg_quality=85):
+    """Convert a PDF into images using PyMuPDF (or pdfium for rendering).
 
     Args:
         pdf_path (str): Path to input PDF.
@@ -15,11 +117,27 @@ def convert_pdf_to_images(pdf_path, output_folder, dpi=300, first_page=None, las
         last_page (int|None): 1-based last page to convert. If None, ends at last page.
         image_format (str): Image file format/extension (png, jpg, etc.).
         verbose (bool): Print progress when True.
+        workers (int|None): Number of encoder threads. If None, uses os.cpu_count().
+            Pages are always rendered on the calling thread.
+        encoder (str): JPEG encoder, "pillow", "turbojpeg" or "mupdf". Ignored for png.
+        png_level (int|None): zlib level (0-9) for PNG output through Pillow.
+            If None, MuPDF's own PNG encoder is used.
+        backend (str): Rendering engine, "pymupdf" or "pdfium" (requires pypdfium2).
+        colorspace (str): "rgb" or "gray". Gray pixmaps use a third of the memory
+            and encode faster, which suits scanned documents.
+        alpha (bool): Keep a transparency channel (png only, pymupdf backend only).
+        jpeg_quality (int): JPEG quality (1-100). Ignored for png.
     """
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
-        if verbose:
-            print(f"Created output directory: {output_folder}")
+    if colorspace not in ("rgb", "gray"):
+        raise ValueError(f"Unsupported colorspace: {colorspace}")
+    if alpha and image_format in JPEG_FORMATS:
+        raise ValueError("JPEG output cannot have an alpha channel")
+    if alpha and backend == "pdfium":
+        raise ValueError("The pdfium backend does not support alpha output")
+
+    os.makedirs(output_folder, exist_ok=True)
+    if verbose:
+        print(f"Output directory: {output_folder}")
 
     try:
         doc = pymupdf.open(pdf_path)
@@ -38,18 +156,93 @@ def convert_pdf_to_images(pdf_path, output_folder, dpi=300, first_page=None, las
         print(f"Converting '{pdf_path}' pages {start+1}..{end+1} to images (dpi={dpi}, format={image_format})...")
 
     matrix = pymupdf.Matrix(dpi / 72.0, dpi / 72.0)
+    cs = pymupdf.csGRAY if colorspace == "gray" else pymupdf.csRGB
+    # Zero-padded page numbers keep files in page order when sorted by name
+    # (page_00002 before page_00010)
+    path_prefix = os.path.join(output_folder, "page_")
+    path_suffix = "." + image_format
+
+    if backend == "pdfium":
+        import pypdfium2 as pdfium
+
+        pdfium_doc = pdfium.PdfDocument(pdf_path)
+
+    # Neither MuPDF nor pdfium supports threading, and MuPDF holds the GIL while
+    # rasterizing, so pages are rendered one at a time on this thread. Encoders
+    # that release the GIL (Pillow, libturbojpeg) run on a pool, and a small
+    # pool of writer threads overlaps file I/O with both.
+    if image_format in JPEG_FORMATS:
+        mupdf_encodes = encoder == "mupdf"
+    else:
+        mupdf_encodes = png_level is None
+    encode_workers = workers or os.cpu_count() or 1
+    write_queue = queue.Queue(maxsize=2 * encode_workers)
+    write_errors = []
+    lock = threading.Lock()
+
+    def get_pixmap(i):
+        if backend == "pdfium":
+            page = pdfium_doc[i]
+            bitmap = page.render(scale=dpi / 72.0, rev_byteorder=True, grayscale=colorspace == "gray")
+            # Copy the packed RGB/gray buffer into a Pixmap so the pdfium
+            # bitmap is freed right away and the normal encoders apply.
+            pix = pymupdf.Pixmap(cs, bitmap.width, bitmap.height, bytes(bitmap.buffer), False)
+            bitmap.close()
+            page.close()
+            return pix
+        return doc.load_page(i).get_pixmap(matrix=matrix, colorspace=cs, alpha=alpha)
+
+    def encode_one(image_path, samples, width, height, n, resolution):
+        if image_format in JPEG_FORMATS:
+            data = _encode_jpeg(samples, width, height, n, encoder=encoder, quality=jpeg_quality, resolution=resolution)
+        else:
+            data = _pil_encode(samples, width, height, n, format="PNG", compress_level=png_level, optimize=False, dpi=resolution)
+        write_queue.put((image_path, data))
 
     try:
-        for i in range(start, end + 1):
-            page = doc.load_page(i)
-            pix = page.get_pixmap(matrix=matrix)
-            image_name = f"page_{i+1}.{image_format}"
-            image_path = os.path.join(output_folder, image_name)
-            pix.save(image_path)
-            if verbose:
-                print(f"Saved: {image_path}")
+        with ThreadPoolExecutor(max_workers=WRITER_THREADS) as writer_pool:
+            for _ in range(WRITER_THREADS):
+                writer_pool.submit(_write_images, write_queue, lock, write_errors, verbose)
+            encode_pool = ThreadPoolExecutor(max_workers=encode_workers)
+            try:
+                # At most 2 * workers pages wait for an encoder, which bounds memory;
+                # result() re-raises an encoder's exception here.
+                pending = deque()
+                for i in range(start, end + 1):
+                    if write_errors:
+                        break
+                    pix = get_pixmap(i)
+                    image_path = f"{path_prefix}{i+1:05d}{path_suffix}"
+                    if mupdf_encodes:
+                        if image_format in JPEG_FORMATS:
+                            data = pix.tobytes(output="jpg", jpg_quality=jpeg_quality)
+                        else:
+                            data = pix.tobytes(image_format)
+                        write_queue.put((image_path, data))
+                        continue
+                    # Only plain bytes cross to the pool, so MuPDF is never called off this thread
+                    pending.append(encode_pool.submit(
+                        encode_one, image_path, pix.samples, pix.width, pix.height, pix.n, (pix.xres, pix.yres)
+                    ))
+                    if len(pending) >= 2 * encode_workers:
+                        pending.popleft().result()
+                while pending:
+                    pending.popleft().result()
+            except BaseException:
+                # Drop the pages still queued for an encoder so the error surfaces now
+                encode_pool.shutdown(cancel_futures=True)
+                raise
+            finally:
+                encode_pool.shutdown()
+                for _ in range(WRITER_THREADS):
+                    write_queue.put(None)
     finally:
         doc.close()
+        if backend == "pdfium":
+            pdfium_doc.close()
+
+    if write_errors:
+        raise write_errors[0]
 
 
 def parse_args(argv=None):
@@ -60,8 +253,18 @@ def parse_args(argv=None):
     parser.add_argument("--first", type=int, default=None, help="First page to convert (1-based)")
     parser.add_argument("--last", type=int, default=None, help="Last page to convert (1-based)")
     parser.add_argument("--format", default="png", choices=["png", "jpg", "jpeg"], help="Output image format (png, jpg)")
+    parser.add_argument("--encoder", default="pillow", choices=["pillow", "turbojpeg", "mupdf"], help="JPEG encoder (default: pillow; ignored for png)")
+    parser.add_argument("--jpeg-quality", type=int, default=85, metavar="1-100", help="JPEG quality (default: 85; ignored for png)")
+    parser.add_argument("--png-level", type=int, default=None, choices=range(10), metavar="0-9", help="Encode PNG via Pillow at this zlib level (lower is faster, larger files; default: MuPDF encoder)")
+    parser.add_argument("--backend", default="pymupdf", choices=["pymupdf", "pdfium"], help="Rendering engine (default: pymupdf; pdfium requires pypdfium2)")
+    parser.add_argument("--gray", action="store_true", help="Render in grayscale (smaller, faster output for scans)")
+    parser.add_argument("--alpha", action="store_true", help="Keep a transparency channel (png only)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of encoder threads (default: CPU count)")
     parser.add_argument("--verbose", action="store_true", help="Print progress messages")
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if not 1 <= args.jpeg_quality <= 100:
+        parser.error(f"--jpeg-quality must be between 1 and 100, got {args.jpeg_quality}")
+    return args
 
 
 def main(argv=None):
@@ -90,6 +293,13 @@ def main(argv=None):
             last_page=args.last,
             image_format=args.format,
             verbose=args.verbose,
+            workers=args.workers,
+            encoder=args.encoder,
+            png_level=args.png_level,
+            backend=args.backend,
+            colorspace="gray" if args.gray else "rgb",
+            alpha=args.alpha,
+            jpeg_quality=args.jpeg_quality,
         )
     except Exception as e:
         print(f"Error converting PDF: {e}", file=sys.stderr)
@@ -5,35 +5,66 @@
 import os
 import re
 import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+_NON_WORD = re.compile(r'[^\w\-\.]')     # keep dots and dashes
+_MULTI_UNDER = re.compile(r'_{2,}')       # collapse repeated underscores
+# ASCII-only names skip the regex: one str.translate pass maps every char outside [A-Za-z0-9_.-]
+_ASCII_SLUG_TABLE = str.maketrans({chr(c): '_' for c in range(128) if not (chr(c).isalnum() or chr(c) in '_-.')})
 
 def slugify(name: str) -> str:
-    name = re.sub(r'[^\w\-\.]', '_', name)          # keep dots and dashes
-    name = re.sub(r'_{2,}', '_', name)              # collapse repeated underscores
-    return name.strip('_')
+    name = name.translate(_ASCII_SLUG_TABLE) if name.isascii() else _NON_WORD.sub('_', name)
+    return _MULTI_UNDER.sub('_', name).strip('_')
 
-def unique_path(dest: Path) -> Path:
-    if not dest.exists():
+def unique_path(dest: str, taken: set) -> str:
+    # `taken` holds every path known to exist (or already assigned) in dest's folder
+    if dest not in taken:
         return dest
-    stem, suffix = dest.stem, dest.suffix
+    stem, suffix = os.path.splitext(dest)
     i = 1
     while True:
-        candidate = dest.with_name(f"{stem}_{i}{suffix}")
-        if not candidate.exists():
+        candidate = f"{stem}_{i}{suffix}"
+        if candidate not in taken:
             return candidate
         i += 1
 
-def collect_files(root: Path, recursive: bool):
-    files = []
-    if recursive:
-        for p in root.rglob('*'):
-            if p.is_file():
-                files.append(p)
-    else:
-        for p in root.iterdir():
-            if p.is_file():
-                files.append(p)
-    return sorted(files)
+def iter_files(root: str, recursive: bool, src_exts=None):
+    # os.scandir exposes the dirent type, so files are told apart without a stat per entry.
+    # Paths are streamed (depth-first, in directory order) rather than collected up front.
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    if src_exts is None or os.path.splitext(entry.name)[1].lower() in src_exts:
+                        yield entry.path
+
+def rename_batch(pairs):
+    # Renames only ever move a file within its own folder, so folders are independent:
+    # each one is handled on a worker thread, keeping the planned order inside it.
+    by_dir = {}
+    for src, dest in pairs:
+        by_dir.setdefault(os.path.dirname(src), []).append((os.path.basename(src), os.path.basename(dest)))
+
+    def rename_in(folder, names):
+        if os.rename not in os.supports_dir_fd:
+            for src, dest in names:
+                os.rename(os.path.join(folder, src), os.path.join(folder, dest))
+            return
+        # renameat() against one open folder fd avoids re-resolving the full path per file
+        fd = os.open(folder, os.O_RDONLY)
+        try:
+            for src, dest in names:
+                os.rename(src, dest, src_dir_fd=fd, dst_dir_fd=fd)
+        finally:
+            os.close(fd)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(by_dir)) or 1) as ex:
+        for _ in ex.map(rename_in, by_dir.keys(), by_dir.values()):
+            pass
 
 def norm_ext(ext: str) -> str:
     if not ext:
@@ -47,7 +78,7 @@ def parse_src_exts(s: str):
     parts = [p.strip() for p in s.split(',') if p.strip()]
     return set(norm_ext(p).lower() for p in parts)
 
-def main():
+def main(argv=None):
     p = argparse.ArgumentParser(description="Batch rename files without opening them")
     p.add_argument("folder", help="Target folder")
     p.add_argument("--mode", choices=["sequential", "slugify", "lowercase", "replace"], default="slugify")
@@ -60,68 +91,73 @@ def main():
     p.add_argument("--change-ext", "-e", help="Change resulting filenames' extension to EXT (e.g. .jpg or jpg)")
     p.add_argument("--only-ext", action="store_true", help="Only change the file extension, keep existing stems")
     p.add_argument("--src-ext", "-s", help="Only operate on files with these source extensions (comma-separated, e.g. .txt,.md or txt,md)")
-    args = p.parse_args()
+    args = p.parse_args(argv)
 
-    root = Path(args.folder)
-    if not root.exists() or not root.is_dir():
+    root = os.path.normpath(args.folder)
+    if not os.path.isdir(root):
         raise SystemExit(f"Folder not found: {root}")
 
-    files = collect_files(root, args.recursive)
-    if not files:
-        print("No files found.")
-        return
-
     src_exts = parse_src_exts(args.src_ext)  # None or set of extensions
-    if src_exts is not None:
-        files = [f for f in files if f.suffix.lower() in src_exts]
-        if not files:
-            print("No files matched the given source extension(s).")
-            return
-
     change_ext = norm_ext(args.change_ext) if args.change_ext else ""
+    if args.only_ext and not change_ext:
+        raise SystemExit("--only-ext requires --change-ext to be provided")
+    if not args.only_ext and args.mode == "replace" and args.replace_from is None:
+        raise SystemExit("replace mode requires --replace-from")
+
+    files = iter_files(root, args.recursive, src_exts)
+    sequential = args.mode == "sequential" and not args.only_ext
+    if sequential:
+        # Numbering needs a deterministic order and the total count for zero padding
+        files = sorted(files)
+        width = max(3, len(str(len(files) + args.start)))
+    idx = args.start
 
-    mapping = {}
-    if args.only_ext:
-        if not change_ext:
-            raise SystemExit("--only-ext requires --change-ext to be provided")
-        for f in files:
-            mapping[f] = f.with_suffix(change_ext)
-    else:
-        if args.mode == "sequential":
-            total = len(files)
-            width = max(3, len(str(total + args.start)))
-            idx = args.start
-            for f in files:
-                new_name = f"{args.prefix}{str(idx).zfill(width)}{f.suffix}"
-                dest = f.with_name(new_name)
-                if change_ext:
-                    dest = dest.with_suffix(change_ext)
-                mapping[f] = dest
-                idx += 1
+    # Ensure uniqueness and perform rename. Each folder is listed once to seed the
+    # set of taken names, instead of probing the filesystem for every candidate.
+    taken = set()
+    listed_dirs = set()
+    renames = []
+    found = False
+    for src in files:
+        found = True
+        parent, name = os.path.split(src)
+        stem, suffix = os.path.splitext(name)
+        if args.only_ext:
+            new_stem = stem
+        elif sequential:
+            new_stem = f"{args.prefix}{str(idx).zfill(width)}"
+            idx += 1
+        elif args.mode == "slugify":
+            new_stem = slugify(stem)
+        elif args.mode == "lowercase":
+            new_stem = stem.lower()
+        elif args.mode == "replace":
+            new_stem = stem.replace(args.replace_from, args.replace_to or "")
         else:
-            for f in files:
-                if args.mode == "slugify":
-                    new_stem = slugify(f.stem)
-                elif args.mode == "lowercase":
-                    new_stem = f.stem.lower()
-                elif args.mode == "replace":
-                    if args.replace_from is None:
-                        raise SystemExit("replace mode requires --replace-from")
-                    new_stem = f.stem.replace(args.replace_from, args.replace_to or "")
-                else:
-                    new_stem = f.stem
-                new_suffix = change_ext if change_ext else f.suffix
-                mapping[f] = f.with_name(new_stem + new_suffix)
-
-    # Ensure uniqueness and perform rename
-    for src, tentative_dest in mapping.items():
-        dest = unique_path(tentative_dest)
-        if src.resolve() == dest.resolve():
+            new_stem = stem
+        new_name = new_stem + (change_ext or suffix)
+        # Renames stay inside the file's own folder; a separator would move the file
+        # elsewhere (rename_batch keeps only the basename) and bypass the collision check.
+        if new_name in ("", ".") or os.sep in new_name or (os.altsep and os.altsep in new_name):
+            raise SystemExit(f"Invalid new name for {src}: {new_name!r}")
+        tentative_dest = os.path.join(parent, new_name)
+        if tentative_dest == src:
             continue
+        if parent not in listed_dirs:
+            listed_dirs.add(parent)
+            taken.update(os.path.join(parent, n) for n in os.listdir(parent))
+        dest = unique_path(tentative_dest, taken)
+        taken.discard(src)
+        taken.add(dest)
         print(f"{src} -> {dest}")
-        if not args.dry_run:
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            os.rename(src, dest)
+        renames.append((src, dest))
+
+    if not found:
+        print("No files matched the given source extension(s)." if src_exts is not None else "No files found.")
+        return
+
+    if not args.dry_run:
+        rename_batch(renames)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
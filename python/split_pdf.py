@@ -1,6 +1,7 @@
 import os
 import argparse
 import sys
+import tempfile
 import pymupdf  # PyMuPDF
 
 
@@ -47,20 +48,19 @@ def split_pdf(input_pdf_path, output_folder, pages_per_file=1, verbose=False):
         )
 
         new_pdf = pymupdf.open()
-        for page_num in range(start_page_idx, end_page_idx + 1):
-            new_pdf.insert_pdf(doc, from_page=page_num, to_page=page_num)
+        new_pdf.insert_pdf(doc, from_page=start_page_idx, to_page=end_page_idx)
 
         try:
-            new_pdf.save(output_pdf_path)
+            new_pdf.save(output_pdf_path, garbage=4, deflate=True, use_objstms=True)
             if verbose:
                 print(f"Created '{output_pdf_name}' with pages {start_page_idx+1}-{end_page_idx+1}")
         except Exception as e:
             print(f"Warning: Could not save part '{output_pdf_name}': {e}", file=sys.stderr)
         finally:
             new_pdf.close()
-        
+
         file_index += 1
-    
+
     doc.close()
     if verbose:
         print("PDF splitting complete.")
@@ -119,6 +119,13 @@ def extract_pages(input_pdf_path, output_pdf_path, start_page, end_page, verbose
     if start_page > end_page:
         raise ValueError("Start page cannot be greater than end page.")
 
+    output_dir = os.path.dirname(output_pdf_path)
+    if output_dir:
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as e:
+            raise RuntimeError(f"Cannot create output directory '{output_dir}': {e}")
+
     try:
         doc = pymupdf.open(input_pdf_path)
     except Exception as e:
@@ -137,21 +144,32 @@ def extract_pages(input_pdf_path, output_pdf_path, start_page, end_page, verbose
     if verbose:
         print(f"Extracting pages {start_page}-{end_page} from '{input_pdf_path}' to '{output_pdf_path}'.")
 
-    new_pdf = pymupdf.open()
-    # PyMuPDF uses 0-based indexing, so we subtract 1
+    # MuPDF refuses a full save over the file it has open, so trimming a PDF in
+    # place saves to a temp file next to it and swaps it in once doc is closed.
+    in_place = os.path.exists(output_pdf_path) and os.path.samefile(input_pdf_path, output_pdf_path)
+    if in_place:
+        fd, save_path = tempfile.mkstemp(suffix=".pdf", dir=output_dir or None)
+        os.close(fd)
+    else:
+        save_path = output_pdf_path
+
+    # PyMuPDF uses 0-based indexing, so we subtract 1. select() trims the
+    # in-memory copy of the source down to the range; the file on disk is untouched.
     try:
-        new_pdf.insert_pdf(doc, from_page=start_page - 1, to_page=end_page - 1)
-        output_dir = os.path.dirname(output_pdf_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-        new_pdf.save(output_pdf_path)
+        doc.select(list(range(start_page - 1, end_page)))
+        doc.save(save_path, garbage=4, deflate=True, clean=True, use_objstms=True)
+        doc.close()
+        if in_place:
+            os.replace(save_path, output_pdf_path)
         if verbose:
             print(f"Successfully created '{output_pdf_path}' with pages {start_page}-{end_page}.")
     except Exception as e:
         print(f"Warning: Could not save extracted PDF '{output_pdf_path}': {e}", file=sys.stderr)
     finally:
-        new_pdf.close()
-        doc.close()
+        if not doc.is_closed:
+            doc.close()
+        if in_place and os.path.exists(save_path):
+            os.remove(save_path)
 
 def main(argv=None):
     """Main function to execute the script from the command line."""
@@ -0,0 +1,85 @@
+"""Tests for img2pdf.py — images to PDF."""
+
+from pathlib import Path
+
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+from PIL import Image
+
+from img2pdf import convert_images_to_pdf, main
+
+
+# ─────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────
+
+def make_image(path: Path, size=(60, 30), color="red") -> Path:
+    Image.new("RGB", size, color).save(path)
+    return path
+
+
+def page_sizes(pdf: Path) -> list:
+    with pymupdf.open(str(pdf)) as doc:
+        return [(round(p.rect.width), round(p.rect.height)) for p in doc]
+
+
+# ─────────────────────────────────────────────
+# Unit: convert_images_to_pdf
+# ─────────────────────────────────────────────
+
+class TestConvertImagesToPdf:
+    def test_one_page_per_image_in_order(self, tmp_path):
+        a = make_image(tmp_path / "a.png", size=(72, 144))
+        b = make_image(tmp_path / "b.jpg", size=(144, 72))
+        out = tmp_path / "out.pdf"
+        convert_images_to_pdf([str(a), str(b)], str(out), dpi=72)
+        assert page_sizes(out) == [(72, 144), (144, 72)]
+
+    def test_unreadable_image_is_skipped(self, tmp_path, capsys):
+        a = make_image(tmp_path / "a.png")
+        bad = tmp_path / "bad.png"
+        bad.write_bytes(b"not an image")
+        out = tmp_path / "out.pdf"
+        convert_images_to_pdf([str(bad), str(a)], str(out), dpi=72)
+        assert len(page_sizes(out)) == 1
+        assert "bad.png" in capsys.readouterr().err
+
+    def test_no_valid_images_raises(self, tmp_path):
+        bad = tmp_path / "bad.png"
+        bad.write_bytes(b"not an image")
+        with pytest.raises(RuntimeError, match="No valid images"):
+            convert_images_to_pdf([str(bad)], str(tmp_path / "out.pdf"))
+
+    def test_large_image_passes_pixel_limit(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)
+        a = make_image(tmp_path / "a.png", size=(300, 300))
+        out = tmp_path / "out.pdf"
+        convert_images_to_pdf([str(a)], str(out), dpi=72)
+        assert page_sizes(out) == [(300, 300)]
+        assert Image.MAX_IMAGE_PIXELS == 100
+
+    def test_import_keeps_pixel_limit(self):
+        assert Image.MAX_IMAGE_PIXELS is not None
+
+
+# ─────────────────────────────────────────────
+# CLI tests
+# ─────────────────────────────────────────────
+
+class TestMainCLI:
+    def test_directory_input(self, tmp_path):
+        make_image(tmp_path / "b.png")
+        make_image(tmp_path / "a.jpg")
+        (tmp_path / "notes.txt").write_text("skip me")
+        out = tmp_path / "out.pdf"
+        assert main([str(tmp_path), str(out)]) == 0
+        assert len(page_sizes(out)) == 2
+
+    def test_unsupported_file_returns_1(self, tmp_path):
+        txt = tmp_path / "notes.txt"
+        txt.write_text("hello")
+        assert main([str(txt), str(tmp_path / "out.pdf")]) == 1
+
+    def test_missing_input_returns_1(self, tmp_path):
+        assert main([str(tmp_path / "missing"), str(tmp_path / "out.pdf")]) == 1
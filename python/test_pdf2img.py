@@ -0,0 +1,266 @@
+"""Tests for pdf2img.py — PDF to images."""
+
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+from PIL import Image
+
+import pdf2img
+from pdf2img import convert_pdf_to_images, main
+
+
+# ─────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────
+
+def make_pdf(path: Path, pages: int = 3) -> Path:
+    """Create a PDF with `pages` small pages."""
+    doc = pymupdf.open()
+    for i in range(pages):
+        page = doc.new_page(width=72, height=72)
+        page.insert_text((10, 40), str(i + 1))
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def names(folder: Path) -> list:
+    return sorted(p.name for p in folder.iterdir())
+
+
+# ─────────────────────────────────────────────
+# Unit: convert_pdf_to_images
+# ─────────────────────────────────────────────
+
+class TestConvertPdfToImages:
+    def test_zero_padded_names(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        out = tmp_path / "out"
+        convert_pdf_to_images(str(pdf), str(out), dpi=72)
+        assert names(out) == ["page_00001.png", "page_00002.png", "page_00003.png"]
+
+    def test_page_range_keeps_page_numbers(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=5)
+        out = tmp_path / "out"
+        convert_pdf_to_images(str(pdf), str(out), dpi=72, first_page=2, last_page=3, image_format="jpg")
+        assert names(out) == ["page_00002.jpg", "page_00003.jpg"]
+
+    @pytest.mark.parametrize("kwargs", [
+        {"image_format": "jpg"},
+        {"image_format": "jpg", "encoder": "mupdf"},
+        {"image_format": "png", "png_level": 1},
+        {"image_format": "png", "colorspace": "gray"},
+    ])
+    def test_encoders_write_valid_images(self, tmp_path, kwargs):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=2)
+        out = tmp_path / "out"
+        convert_pdf_to_images(str(pdf), str(out), dpi=72, **kwargs)
+        for name in names(out):
+            pix = pymupdf.Pixmap(str(out / name))
+            assert (pix.width, pix.height) == (72, 72)
+
+    @pytest.mark.parametrize("colorspace", ["rgb", "gray"])
+    def test_alpha_png_level_matches_mupdf_encoder(self, tmp_path, colorspace):
+        # A 50% opaque red fill: MuPDF's samples are premultiplied, and both
+        # encoders must write the same straight-alpha pixels.
+        doc = pymupdf.open()
+        page = doc.new_page(width=72, height=72)
+        page.draw_rect(page.rect, fill=(1, 0, 0), fill_opacity=0.5, width=0)
+        pdf = tmp_path / "translucent.pdf"
+        doc.save(str(pdf))
+        doc.close()
+        convert_pdf_to_images(str(pdf), str(tmp_path / "mupdf"), dpi=72, alpha=True, colorspace=colorspace)
+        convert_pdf_to_images(str(pdf), str(tmp_path / "pil"), dpi=72, alpha=True, colorspace=colorspace, png_level=1)
+        with Image.open(tmp_path / "mupdf" / "page_00001.png") as expected, \
+                Image.open(tmp_path / "pil" / "page_00001.png") as actual:
+            assert actual.size == expected.size == (72, 72)
+            assert actual.mode == expected.mode == ("RGBA" if colorspace == "rgb" else "LA")
+            want, got = expected.getpixel((36, 36)), actual.getpixel((36, 36))
+            assert all(abs(a - b) <= 1 for a, b in zip(want, got)), (want, got)
+            assert 120 < got[-1] < 135
+
+    def test_creates_nested_output_folder(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=1)
+        out = tmp_path / "a" / "b"
+        convert_pdf_to_images(str(pdf), str(out), dpi=72)
+        assert names(out) == ["page_00001.png"]
+
+    def test_write_error_propagates(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        out = tmp_path / "out"
+        # A directory where the first image should go makes its write fail
+        (out / "page_00001.png").mkdir(parents=True)
+        with pytest.raises(IsADirectoryError):
+            convert_pdf_to_images(str(pdf), str(out), dpi=72)
+
+    def test_encoder_error_cancels_queued_pages(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=20)
+        out = tmp_path / "out"
+        # Two encoders with a window of four pages. One encode fails once all four
+        # are submitted; the other blocks until the pool is shut down, so page 4
+        # can only run if the shutdown did not cancel it.
+        window_full = threading.Event()
+        release = threading.Event()
+        calls = []
+        lock = threading.Lock()
+
+        class GatedExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, fn, *args, **kwargs):
+                future = super().submit(fn, *args, **kwargs)
+                if fn.__name__ == "encode_one":
+                    self.submitted += 1
+                    if self.submitted == 4:
+                        window_full.set()
+                return future
+
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                super().shutdown(wait=False, cancel_futures=cancel_futures)
+                release.set()
+                super().shutdown(wait=wait)
+
+        def gated_encode(*args, **kwargs):
+            with lock:
+                calls.append(args)
+                first = len(calls) == 1
+            if first:
+                window_full.wait()
+                raise RuntimeError("encode failed")
+            release.wait()
+            return b""
+
+        with patch.object(pdf2img, "ThreadPoolExecutor", GatedExecutor), \
+                patch.object(pdf2img, "_encode_jpeg", gated_encode):
+            with pytest.raises(RuntimeError, match="encode failed"):
+                convert_pdf_to_images(str(pdf), str(out), dpi=72, image_format="jpg", workers=2)
+        # Page 3 may start on the freed worker before the cancel; page 4 cannot
+        assert len(calls) <= 3
+        assert "page_00004.jpg" not in names(out)
+
+    def test_alpha_with_jpeg_raises(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=1)
+        with pytest.raises(ValueError, match="alpha"):
+            convert_pdf_to_images(str(pdf), str(tmp_path / "out"), image_format="jpg", alpha=True)
+
+    def test_alpha_with_pdfium_raises(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=1)
+        with pytest.raises(ValueError, match="alpha"):
+            convert_pdf_to_images(str(pdf), str(tmp_path / "out"), backend="pdfium", alpha=True)
+
+    def test_unknown_colorspace_raises(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=1)
+        with pytest.raises(ValueError, match="colorspace"):
+            convert_pdf_to_images(str(pdf), str(tmp_path / "out"), colorspace="cmyk")
+
+    def test_invalid_page_range_raises(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        with pytest.raises(ValueError, match="Invalid page range"):
+            convert_pdf_to_images(str(pdf), str(tmp_path / "out"), first_page=3, last_page=2)
+
+
+# ─────────────────────────────────────────────
+# Optional encoders and backends
+# ─────────────────────────────────────────────
+
+def make_red_bar_pdf(path: Path, width: int = 73, height: int = 40) -> Path:
+    """A white page with a red bar down its left 10 pt; an odd width by default."""
+    doc = pymupdf.open()
+    page = doc.new_page(width=width, height=height)
+    page.draw_rect(pymupdf.Rect(0, 0, 10, height), color=None, fill=(1, 0, 0), width=0)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def approx_pixel(got, want, tolerance=2):
+    """Compare gray ints or color tuples channel by channel."""
+    if isinstance(want, int):
+        got, want = (got,), (want,)
+    return all(abs(g - w) <= tolerance for g, w in zip(got, want))
+
+
+@pytest.fixture
+def turbojpeg():
+    module = pytest.importorskip("turbojpeg")
+    try:
+        module.TurboJPEG()
+    except RuntimeError as e:
+        pytest.skip(f"libturbojpeg cannot be loaded: {e}")
+    return module
+
+
+class TestTurboJpegEncoder:
+    @pytest.mark.parametrize("colorspace, mode", [("rgb", "RGB"), ("gray", "L")])
+    def test_writes_jpeg(self, tmp_path, turbojpeg, colorspace, mode):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=2)
+        out = tmp_path / "out"
+        convert_pdf_to_images(str(pdf), str(out), dpi=72, image_format="jpg", encoder="turbojpeg", colorspace=colorspace)
+        assert names(out) == ["page_00001.jpg", "page_00002.jpg"]
+        for name in names(out):
+            with Image.open(out / name) as img:
+                assert img.format == "JPEG"
+                assert (img.size, img.mode) == ((72, 72), mode)
+
+    def test_instance_is_shared(self, turbojpeg):
+        assert pdf2img._get_turbojpeg() is pdf2img._get_turbojpeg()
+
+
+class TestPdfiumBackend:
+    @pytest.fixture(autouse=True)
+    def _pdfium(self):
+        pytest.importorskip("pypdfium2")
+
+    @pytest.mark.parametrize("colorspace, mode, red, white", [
+        ("rgb", "RGB", (255, 0, 0), (255, 255, 255)),
+        ("gray", "L", 76, 255),
+    ])
+    def test_odd_width_page(self, tmp_path, colorspace, mode, red, white):
+        # 73 px rows are not 4-byte aligned; a stride mix-up would shear the bar
+        pdf = make_red_bar_pdf(tmp_path / "doc.pdf")
+        out = tmp_path / "out"
+        convert_pdf_to_images(str(pdf), str(out), dpi=72, backend="pdfium", colorspace=colorspace)
+        with Image.open(out / "page_00001.png") as img:
+            assert (img.size, img.mode) == ((73, 40), mode)
+            for y in (0, 39):
+                assert approx_pixel(img.getpixel((5, y)), red)
+                assert approx_pixel(img.getpixel((40, y)), white)
+
+    def test_jpeg_output(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=2)
+        out = tmp_path / "out"
+        convert_pdf_to_images(str(pdf), str(out), dpi=72, backend="pdfium", image_format="jpg")
+        assert names(out) == ["page_00001.jpg", "page_00002.jpg"]
+        with Image.open(out / "page_00002.jpg") as img:
+            assert (img.size, img.mode) == ((72, 72), "RGB")
+
+
+# ─────────────────────────────────────────────
+# CLI tests
+# ─────────────────────────────────────────────
+
+class TestMainCLI:
+    def test_missing_pdf_returns_2(self, tmp_path):
+        assert main([str(tmp_path / "missing.pdf"), str(tmp_path / "out")]) == 2
+
+    def test_non_pdf_returns_3(self, tmp_path):
+        txt = tmp_path / "file.txt"
+        txt.write_text("hello")
+        assert main([str(txt), str(tmp_path / "out")]) == 3
+
+    def test_jpeg_quality_out_of_range_exits(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=1)
+        with pytest.raises(SystemExit) as exc:
+            main([str(pdf), str(tmp_path / "out"), "--jpeg-quality", "0"])
+        assert exc.value.code != 0
+
+    def test_writes_into_pdf_named_subfolder(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=2)
+        result = main([str(pdf), str(tmp_path / "out"), "--dpi", "72", "--format", "jpg"])
+        assert result == 0
+        assert names(tmp_path / "out" / "doc") == ["page_00001.jpg", "page_00002.jpg"]
@@ -0,0 +1,145 @@
+"""Tests for rename_file.py — batch file renamer."""
+
+from pathlib import Path
+
+import pytest
+
+from rename_file import slugify, unique_path, main
+
+
+# ─────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────
+
+def touch(path: Path, content: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content or path.name)
+    return path
+
+
+def names(folder: Path) -> list:
+    return sorted(p.name for p in folder.iterdir() if p.is_file())
+
+
+# ─────────────────────────────────────────────
+# Unit: slugify / unique_path
+# ─────────────────────────────────────────────
+
+class TestSlugify:
+    def test_ascii(self):
+        assert slugify("My File (1)") == "My_File_1"
+
+    def test_keeps_dots_and_dashes(self):
+        assert slugify("a-b.c") == "a-b.c"
+
+    def test_collapses_and_strips_underscores(self):
+        assert slugify("__a  b__") == "a_b"
+
+    def test_unicode_word_chars_kept(self):
+        assert slugify("café menü") == "café_menü"
+
+
+class TestUniquePath:
+    def test_free_name_unchanged(self):
+        assert unique_path("/d/a.txt", set()) == "/d/a.txt"
+
+    def test_first_free_suffix(self):
+        taken = {"/d/a.txt", "/d/a_1.txt"}
+        assert unique_path("/d/a.txt", taken) == "/d/a_2.txt"
+
+
+# ─────────────────────────────────────────────
+# CLI tests
+# ─────────────────────────────────────────────
+
+class TestMainCLI:
+    def test_unchanged_name_is_skipped(self, tmp_path, capsys):
+        touch(tmp_path / "already_clean.txt")
+        touch(tmp_path / "needs fixing.txt")
+        main([str(tmp_path)])
+        out = capsys.readouterr().out
+        assert "already_clean" not in out
+        assert names(tmp_path) == ["already_clean.txt", "needs_fixing.txt"]
+
+    def test_colliding_slugs_get_suffix(self, tmp_path):
+        touch(tmp_path / "a b.txt", "one")
+        touch(tmp_path / "a  b.txt", "two")
+        main([str(tmp_path)])
+        assert names(tmp_path) == ["a_b.txt", "a_b_1.txt"]
+        contents = sorted(p.read_text() for p in tmp_path.iterdir())
+        assert contents == ["one", "two"]
+
+    def test_collision_with_existing_file(self, tmp_path):
+        touch(tmp_path / "a_b.txt", "kept")
+        touch(tmp_path / "a b.txt", "moved")
+        main([str(tmp_path)])
+        assert (tmp_path / "a_b.txt").read_text() == "kept"
+        assert (tmp_path / "a_b_1.txt").read_text() == "moved"
+
+    def test_rename_into_name_freed_earlier(self, tmp_path):
+        # Sorted order: 002.txt becomes 001.txt first, which frees 002.txt for x.txt
+        touch(tmp_path / "002.txt", "two")
+        touch(tmp_path / "x.txt", "x")
+        main([str(tmp_path), "--mode", "sequential"])
+        assert names(tmp_path) == ["001.txt", "002.txt"]
+        assert (tmp_path / "001.txt").read_text() == "two"
+        assert (tmp_path / "002.txt").read_text() == "x"
+
+    def test_sequential_numbering_across_subfolders(self, tmp_path):
+        touch(tmp_path / "a" / "x.txt")
+        touch(tmp_path / "a" / "y.txt")
+        touch(tmp_path / "b" / "z.txt")
+        main([str(tmp_path), "--mode", "sequential", "--recursive", "--prefix", "img_"])
+        assert names(tmp_path / "a") == ["img_001.txt", "img_002.txt"]
+        assert names(tmp_path / "b") == ["img_003.txt"]
+
+    def test_not_recursive_by_default(self, tmp_path):
+        touch(tmp_path / "sub" / "A B.txt")
+        main([str(tmp_path)])
+        assert names(tmp_path / "sub") == ["A B.txt"]
+
+    def test_dry_run_touches_nothing(self, tmp_path, capsys):
+        touch(tmp_path / "a b.txt")
+        touch(tmp_path / "sub" / "c d.txt")
+        main([str(tmp_path), "--recursive", "--dry-run"])
+        assert "a_b.txt" in capsys.readouterr().out
+        assert names(tmp_path) == ["a b.txt"]
+        assert names(tmp_path / "sub") == ["c d.txt"]
+
+    def test_change_ext_only(self, tmp_path):
+        touch(tmp_path / "My File.TXT")
+        main([str(tmp_path), "--only-ext", "--change-ext", "md"])
+        assert names(tmp_path) == ["My File.md"]
+
+    def test_src_ext_filter(self, tmp_path):
+        touch(tmp_path / "A B.txt")
+        touch(tmp_path / "C D.md")
+        main([str(tmp_path), "--src-ext", "txt"])
+        assert names(tmp_path) == ["A_B.txt", "C D.md"]
+
+    def test_no_matching_files(self, tmp_path, capsys):
+        touch(tmp_path / "a.md")
+        main([str(tmp_path), "--src-ext", ".txt"])
+        assert "No files matched" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("args", [
+        ["--mode", "replace", "--replace-from", "a", "--replace-to", "sub/x"],
+        ["--mode", "sequential", "--prefix", "sub/"],
+    ])
+    def test_separator_in_new_name_exits(self, tmp_path, args):
+        touch(tmp_path / "a.txt", "a")
+        touch(tmp_path / "x.txt", "x")
+        (tmp_path / "sub").mkdir()
+        with pytest.raises(SystemExit, match="Invalid new name"):
+            main([str(tmp_path)] + args)
+        assert (tmp_path / "a.txt").read_text() == "a"
+        assert (tmp_path / "x.txt").read_text() == "x"
+        assert list((tmp_path / "sub").iterdir()) == []
+
+    def test_missing_folder_exits(self, tmp_path):
+        with pytest.raises(SystemExit):
+            main([str(tmp_path / "missing")])
+
+    def test_only_ext_requires_change_ext(self, tmp_path):
+        with pytest.raises(SystemExit):
+            main([str(tmp_path), "--only-ext"])
@@ -0,0 +1,111 @@
+"""Tests for split_pdf.py — PDF splitter and page extractor."""
+
+from pathlib import Path
+
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+
+from split_pdf import extract_pages, split_pdf, main
+
+
+# ─────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────
+
+def make_pdf(path: Path, pages: int = 5) -> Path:
+    """Create a PDF whose page i has width 100 + i, so pages can be told apart."""
+    doc = pymupdf.open()
+    for i in range(pages):
+        doc.new_page(width=100 + i, height=100)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def page_widths(pdf: Path) -> list:
+    with pymupdf.open(str(pdf)) as doc:
+        return [round(p.rect.width) for p in doc]
+
+
+# ─────────────────────────────────────────────
+# Unit: split_pdf
+# ─────────────────────────────────────────────
+
+class TestSplitPdf:
+    def test_one_page_per_file(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=3)
+        out = tmp_path / "parts"
+        split_pdf(str(pdf), str(out))
+        assert sorted(p.name for p in out.iterdir()) == ["doc_part001.pdf", "doc_part002.pdf", "doc_part003.pdf"]
+        assert page_widths(out / "doc_part002.pdf") == [101]
+
+    def test_last_part_is_shorter(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=5)
+        out = tmp_path / "parts"
+        split_pdf(str(pdf), str(out), pages_per_file=2)
+        assert page_widths(out / "doc_part001.pdf") == [100, 101]
+        assert page_widths(out / "doc_part003.pdf") == [104]
+
+    def test_invalid_pages_per_file_raises(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        with pytest.raises(ValueError):
+            split_pdf(str(pdf), str(tmp_path / "parts"), pages_per_file=0)
+
+
+# ─────────────────────────────────────────────
+# Unit: extract_pages
+# ─────────────────────────────────────────────
+
+class TestExtractPages:
+    def test_extracts_range(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        out = tmp_path / "nested" / "out.pdf"
+        extract_pages(str(pdf), str(out), 2, 4)
+        assert page_widths(out) == [101, 102, 103]
+        # The source is never modified
+        assert len(page_widths(pdf)) == 5
+
+    def test_trims_in_place(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        extract_pages(str(pdf), str(pdf), 1, 2)
+        assert page_widths(pdf) == [100, 101]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["doc.pdf"]
+
+    def test_end_page_clamped(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        out = tmp_path / "out.pdf"
+        extract_pages(str(pdf), str(out), 4, 99)
+        assert page_widths(out) == [103, 104]
+
+    def test_start_page_past_end_raises(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        with pytest.raises(ValueError, match="exceeds total pages"):
+            extract_pages(str(pdf), str(tmp_path / "out.pdf"), 6, 7)
+
+    def test_uncreatable_output_dir_raises(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        (tmp_path / "blocker").write_text("a file, not a folder")
+        with pytest.raises(RuntimeError, match="Cannot create output directory"):
+            extract_pages(str(pdf), str(tmp_path / "blocker" / "out.pdf"), 1, 2)
+
+
+# ─────────────────────────────────────────────
+# CLI tests
+# ─────────────────────────────────────────────
+
+class TestMainCLI:
+    def test_split(self, tmp_path):
+        pdf = make_pdf(tmp_path / "doc.pdf", pages=4)
+        assert main(["split", str(pdf), str(tmp_path / "parts"), "--pages-per-file", "2"]) == 0
+        assert len(list((tmp_path / "parts").iterdir())) == 2
+
+    def test_extract_into_file_blocker_returns_1(self, tmp_path, capsys):
+        pdf = make_pdf(tmp_path / "doc.pdf")
+        (tmp_path / "blocker").write_text("a file, not a folder")
+        result = main(["extract", str(pdf), str(tmp_path / "blocker" / "out.pdf"), "1", "2"])
+        assert result == 1
+        assert "Cannot create output directory" in capsys.readouterr().err
+
+    def test_missing_input_returns_1(self, tmp_path):
+        assert main(["split", str(tmp_path / "missing.pdf"), str(tmp_path / "parts")]) == 1